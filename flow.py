@@ -9,132 +9,267 @@ that continues indefinitely until manually cancelled.
 
 import sys
 import os
+import atexit
 from datetime import datetime
 import json
+import re
+import importlib.util
 
+# Line editing and history for input(); not available on Windows
 try:
-    import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
-    from ttkbootstrap.scrolled import ScrolledText
-    TTK_AVAILABLE = True
-    print("✅ ttkbootstrap available - Using modern UI")
+    import readline  # noqa: F401
 except ImportError:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext
-    TTK_AVAILABLE = False
-    print("⚠️ ttkbootstrap not available - Using standard tkinter")
-    print("💡 Install with: pip install ttkbootstrap")
+    pass
+
+_now = datetime.now
+
+# Paths resolved once at import
+_SELF_PATH = os.path.abspath(__file__)
+_HERE = os.path.dirname(_SELF_PATH)
+_LOG_PATH = os.path.join(_HERE, 'session_log.jsonl')
+_LEGACY_LOG_PATH = os.path.join(_HERE, 'session_log.json')
+_GUI_HELPER_PATH = os.path.join(_HERE, 'gui_helper.py')
+
+# Keywords recognised in user input
+_HELP_RE = re.compile(r'\bhelp\b', re.IGNORECASE)
+_GUI_TRIGGERS = frozenset({'gui', 'edit', 'editor'})
+
+# Static terminal panels, each emitted with a single write
+BANNER_TEMPLATE = "\n" + "="*50 + """
+🔄 GITHUB COPILOT CONTINUOUS CHECKPOINT
+""" + "="*50 + """
+⏰ Time: {ts}
+📍 Ready for next iteration
+""" + "-"*50 + "\n"
+
+OPTIONS_TEXT = """
+💬 What would you like to do next?
+
+📋 Options:
+   🔄 Continue: Describe changes, improvements, or new features
+   📝 GUI: Type 'gui' or 'edit' to open detailed instruction editor
+   ❓ Help: Type 'help' for more options
+
+""" + "-"*50 + "\n"
+
+RESPONSE_TEMPLATE = "\n" + "="*50 + """
+📤 RESPONSE FOR GITHUB COPILOT:
+""" + "="*50 + """
+{response}
+""" + "="*50 + "\n"
+
+HELP_TEXT = "\n" + "="*50 + """
+📚 HELP - Continuous Flow System
+""" + "="*50 + """
+
+🔄 TO CONTINUE:
+   - Describe what you want to change or add
+   - Example: 'Add a dark mode toggle'
+   - Example: 'Fix the responsive design issues'
+   - Example: 'Add more animations'
+
+📝 DETAILED INSTRUCTIONS (GUI):
+   - Type: 'gui', 'edit', or 'editor' to open GUI
+   - Write detailed instructions with bullets and formatting
+   - After submitting, you can type 'edit' to modify the same content
+   - Use Ctrl+Enter to quickly submit from GUI
+
+⚠️ IMPORTANT:
+   - This is a continuous workflow - it never ends automatically
+   - To stop: Cancel the terminal command (Ctrl+C)
+   - Each iteration will run flow.py again
+
+💡 TIPS:
+   - Use GUI for complex, multi-step instructions
+   - After GUI input, you can edit the same content multiple times
+   - Be specific about what you want
+   - You can ask for multiple changes at once
+
+""" + "-"*50 + "\n"
+
+# Compact JSON for log lines - no indentation or padding
+_JSON_SEPARATORS = (',', ':')
+
+# GUI backend, detected on first use of the editor (None until then)
+_TTK_AVAILABLE = None
+
+# Session log handle, opened line-buffered on first use and reused afterwards
+_LOG_FH = None
+
+# GUI helper process, started on first use of the editor and kept for the
+# rest of the session so reopening it skips tkinter/theme startup
+_GUI_PROC = None
+
+# The helper's stderr goes to a temp file rather than a pipe: nothing reads
+# it while the helper is alive, and a full pipe would stall the helper
+_GUI_ERR = None
 
 def print_banner():
     """Print the review banner"""
-    print("\n" + "="*50)
-    print("🔄 GITHUB COPILOT CONTINUOUS CHECKPOINT")
-    print("="*50)
-    print(f"⏰ Time: {datetime.now().strftime('%H:%M:%S')}")
-    print(f"📍 Ready for next iteration")
-    print("-"*50)
+    sys.stdout.write(BANNER_TEMPLATE.format(ts=_now().isoformat(timespec='seconds')[11:19]))
+    sys.stdout.flush()
+
+def _detect_gui():
+    """Report which GUI backend the editor will use (checked once per run)"""
+    global _TTK_AVAILABLE
+    if _TTK_AVAILABLE is None:
+        # find_spec locates the package without importing it; the helper
+        # process does the actual import
+        _TTK_AVAILABLE = importlib.util.find_spec('ttkbootstrap') is not None
+        if _TTK_AVAILABLE:
+            print("✅ ttkbootstrap available - Using modern UI")
+        else:
+            print("⚠️ ttkbootstrap not available - Using standard tkinter")
+            print("💡 Install with: pip install ttkbootstrap")
+    return _TTK_AVAILABLE
+
+def _gui_process():
+    """Return the running GUI helper, starting it in serve mode if needed"""
+    global _GUI_PROC, _GUI_ERR
+    if _GUI_PROC is None or _GUI_PROC.poll() is not None:
+        import subprocess
+        import tempfile
+        
+        if _GUI_PROC is None:
+            atexit.register(_close_gui_process)
+        else:
+            _GUI_ERR.close()
+        _GUI_ERR = tempfile.TemporaryFile('w+', errors='replace')
+        _GUI_PROC = subprocess.Popen(
+            [sys.executable, _GUI_HELPER_PATH, '--serve'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=_GUI_ERR,
+            text=True,
+            bufsize=1
+        )
+    return _GUI_PROC
+
+def _close_gui_process():
+    """Let the GUI helper exit by closing its request pipe"""
+    if _GUI_PROC is not None and _GUI_PROC.poll() is None:
+        try:
+            _GUI_PROC.stdin.close()
+            _GUI_PROC.wait(timeout=5)
+        except Exception:
+            _GUI_PROC.kill()
+
+def _interrupted():
+    """End the session cleanly after Ctrl+C"""
+    print("\n\n⚠️ Session interrupted by user")
+    sys.exit(0)
+
+def _gui_stderr():
+    """Return what the exited GUI helper wrote to stderr"""
+    _GUI_PROC.wait()
+    _GUI_ERR.seek(0)
+    return _GUI_ERR.read()
+
+def _read_one(prompt):
+    """Read one stripped line of input, ending the session on Ctrl+C or EOF"""
+    try:
+        return input(prompt).strip()
+    except KeyboardInterrupt:
+        _interrupted()
+    except EOFError:
+        print("\n\n⚠️ Input stream ended")
+        sys.exit(0)
 
 def get_user_input():
     """Get user feedback and instructions"""
-    print("\n💬 What would you like to do next?")
-    print("\n📋 Options:")
-    print("   🔄 Continue: Describe changes, improvements, or new features")
-    print("   📝 GUI: Type 'gui' or 'edit' to open detailed instruction editor")
-    print("   ❓ Help: Type 'help' for more options")
-    print("\n" + "-"*50)
+    sys.stdout.write(OPTIONS_TEXT)
+    sys.stdout.flush()
     
     while True:
-        try:
-            user_input = input("\n👤 Your instruction (or 'gui' for editor): ").strip()
-            
-            if not user_input:
-                print("⚠️ Please enter an instruction...")
-                continue
+        while (user_input := _read_one("\n👤 Your instruction (or 'gui' for editor): ")) == '':
+            print("⚠️ Please enter an instruction...")
+        
+        lowered = user_input.lower()
+        
+        # Check if user wants to open GUI
+        if lowered in _GUI_TRIGGERS:
+            _detect_gui()
+            current_content = ""
             
-            # Check if user wants to open GUI
-            if user_input.lower() in ['gui', 'edit', 'editor']:
-                current_content = ""
-                
-                while True:  # Loop for GUI editing
-                    print("🔄 Opening GUI editor...")
-                    try:
-                        # Use subprocess to completely isolate GUI
-                        import subprocess
-                        import sys
-                        
-                        # Path to the GUI helper script
-                        gui_helper_path = os.path.join(os.path.dirname(__file__), 'gui_helper.py')
-                        
-                        # Run GUI in separate process - NO TIMEOUT
-                        result = subprocess.run(
-                            [sys.executable, gui_helper_path, current_content],
-                            capture_output=True,
-                            text=True
-                        )
-                        
-                        # Parse result
-                        if result.returncode == 0:
-                            output = result.stdout.strip()
-                            if "GUI_RESULT_CANCELLED" in output:
-                                print("❌ GUI cancelled by user")
+            while True:  # Loop for GUI editing
+                print("🔄 Opening GUI editor...")
+                try:
+                    # GUI runs in a separate, reused process - NO TIMEOUT
+                    proc = _gui_process()
+                    proc.stdin.write(json.dumps({'text': current_content}, separators=_JSON_SEPARATORS) + '\n')
+                    proc.stdin.flush()
+                    
+                    # Read the result as the helper prints it, stopping at the end marker
+                    status = None
+                    lines = []
+                    for line in proc.stdout:
+                        marker = line.strip()
+                        if status == 'capturing':
+                            if marker == "GUI_RESULT_END":
+                                status = 'received'
                                 break
-                            elif "GUI_RESULT_START" in output and "GUI_RESULT_END" in output:
-                                # Extract content between markers
-                                start_idx = output.find("GUI_RESULT_START") + len("GUI_RESULT_START")
-                                end_idx = output.find("GUI_RESULT_END")
-                                content = output[start_idx:end_idx].strip()
-                                
-                                if content:
-                                    current_content = content
-                                    print(f"\n✅ Instructions received from GUI:")
-                                    print("=" * 60)
-                                    print(content)
-                                    print("=" * 60)
-                                    print("📋 Press Enter to execute these instructions")
-                                    print("    or type 'edit' and press Enter to modify them...")
-                                    
-                                    # Wait for user choice
-                                    choice = input("👤 Your choice: ").strip().lower()
-                                    
-                                    if choice == 'edit':
-                                        print("🔄 Reopening GUI editor with current content...")
-                                        continue  # Continue the GUI editing loop
-                                    else:
-                                        # User pressed Enter or typed something else - execute instructions
-                                        return content
-                                else:
-                                    print("⚠️ No content received from GUI")
-                                    break
+                            lines.append(line)
+                        elif marker == "GUI_RESULT_START":
+                            status = 'capturing'
+                        elif marker == "GUI_RESULT_CANCELLED":
+                            status = 'cancelled'
+                            break
+                    
+                    # Output ended without a marker - the helper has exited
+                    stderr = _gui_stderr() if status in (None, 'capturing') else ''
+                    
+                    # Parse result
+                    if status == 'cancelled':
+                        print("❌ GUI cancelled by user")
+                        break
+                    elif status == 'received':
+                        content = "".join(lines).strip()
+                        
+                        if content:
+                            current_content = content
+                            print(f"\n✅ Instructions received from GUI:")
+                            print("=" * 60)
+                            print(content)
+                            print("=" * 60)
+                            print("📋 Press Enter to execute these instructions")
+                            print("    or type 'edit' and press Enter to modify them...")
+                            
+                            # Wait for user choice
+                            choice = _read_one("👤 Your choice: ").lower()
+                            
+                            if choice == 'edit':
+                                print("🔄 Reopening GUI editor with current content...")
+                                continue  # Continue the GUI editing loop
                             else:
-                                print("⚠️ Unexpected GUI output")
-                                break
+                                # User pressed Enter or typed something else - execute instructions
+                                return content
                         else:
-                            print(f"⚠️ GUI process failed: {result.stderr}")
+                            print("⚠️ No content received from GUI")
                             break
-                            
-                    except Exception as e:
-                        print(f"⚠️ Error running GUI: {e}")
-                        # Fallback to terminal input
+                    elif proc.returncode != 0:
+                        print(f"⚠️ GUI process failed: {stderr}")
                         break
-                
-                # If we get here, GUI was cancelled or failed, continue with normal input
-                continue  # Continue main input loop
-            
-            return user_input
+                    else:
+                        print("⚠️ Unexpected GUI output")
+                        break
+                        
+                except KeyboardInterrupt:
+                    # Ctrl+C while waiting on the editor
+                    _interrupted()
+                except Exception as e:
+                    print(f"⚠️ Error running GUI: {e}")
+                    # Fallback to terminal input
+                    break
             
-        except KeyboardInterrupt:
-            print("\n\n⚠️ Session interrupted by user")
-            sys.exit(0)
-        except EOFError:
-            print("\n\n⚠️ Input stream ended")
-            sys.exit(0)
+            # If we get here, GUI was cancelled or failed, continue with normal input
+            continue  # Continue main input loop
+        
+        return user_input
 
 def process_input(user_input):
     """Process and categorize user input - always continue"""
-    input_lower = user_input.lower().strip()
-    
-    # Check for help
-    if 'help' in input_lower:
+    # Check for help - whole words only, so "helper" doesn't trigger it
+    if _HELP_RE.search(user_input):
         return 'help', user_input
     
     # Always continue - never finish
@@ -142,32 +277,8 @@ def process_input(user_input):
 
 def show_help():
     """Show help information"""
-    print("\n" + "="*50)
-    print("📚 HELP - Continuous Flow System")
-    print("="*50)
-    print("\n🔄 TO CONTINUE:")
-    print("   - Describe what you want to change or add")
-    print("   - Example: 'Add a dark mode toggle'")
-    print("   - Example: 'Fix the responsive design issues'")
-    print("   - Example: 'Add more animations'")
-    
-    print("\n📝 DETAILED INSTRUCTIONS (GUI):")
-    print("   - Type: 'gui', 'edit', or 'editor' to open GUI")
-    print("   - Write detailed instructions with bullets and formatting")
-    print("   - After submitting, you can type 'edit' to modify the same content")
-    print("   - Use Ctrl+Enter to quickly submit from GUI")
-    
-    print("\n⚠️ IMPORTANT:")
-    print("   - This is a continuous workflow - it never ends automatically")
-    print("   - To stop: Cancel the terminal command (Ctrl+C)")
-    print("   - Each iteration will run flow.py again")
-    
-    print("\n💡 TIPS:")
-    print("   - Use GUI for complex, multi-step instructions")
-    print("   - After GUI input, you can edit the same content multiple times")
-    print("   - Be specific about what you want")
-    print("   - You can ask for multiple changes at once")
-    print("\n" + "-"*50)
+    sys.stdout.write(HELP_TEXT)
+    sys.stdout.flush()
 
 def generate_response(action, user_input):
     """Generate appropriate response for GitHub Copilot"""
@@ -180,7 +291,7 @@ Please implement the following request:
 {user_input}
 
 CRITICAL: After completing the above tasks, you MUST run:
-python {os.path.abspath(__file__)}
+python {_SELF_PATH}
 
 This is a continuous workflow that requires running flow.py after each iteration.
 DO NOT conclude or finish the session - always run flow.py for the next checkpoint.
@@ -194,44 +305,54 @@ Waiting for next instruction...
 Remember: After any task completion, run flow.py again.
 """
 
+def migrate_legacy_log():
+    """Convert an old session_log.json array into JSON Lines (runs once)"""
+    if not os.path.exists(_LEGACY_LOG_PATH):
+        return
+    
+    # Move the original out of the way first, so a failure part-way through
+    # can never make the next save migrate (and append) the entries again
+    migrated_path = _LEGACY_LOG_PATH + '.migrated'
+    os.replace(_LEGACY_LOG_PATH, migrated_path)
+    
+    try:
+        with open(migrated_path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        logs = json.loads(content) if content else []
+    except (json.JSONDecodeError, ValueError):
+        logs = None
+    if not isinstance(logs, list):
+        logs = []
+        print("⚠️ JSON log file was corrupted, starting fresh")
+    
+    with open(_LOG_PATH, 'a', encoding='utf-8') as f:
+        for entry in logs:
+            f.write(json.dumps(entry, separators=_JSON_SEPARATORS) + '\n')
+
 def save_session_log(action, user_input):
-    """Save session interaction to log file"""
+    """Append session interaction to the JSON Lines log file"""
+    global _LOG_FH
     log_entry = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _now().isoformat(),
         'action': action,
         'user_input': user_input
     }
     
-    log_file = os.path.join(os.path.dirname(__file__), 'session_log.json')
-    
     try:
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        logs = json.loads(content)
-                    else:
-                        logs = []
-            except (json.JSONDecodeError, ValueError):
-                # If JSON is corrupted, start fresh
-                logs = []
-                print("⚠️ JSON log file was corrupted, starting fresh")
-        else:
-            logs = []
-        
-        logs.append(log_entry)
+        if _LOG_FH is None:
+            migrate_legacy_log()
+            _LOG_FH = open(_LOG_PATH, 'a', buffering=1, encoding='utf-8')
+            atexit.register(_LOG_FH.close)
         
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        _LOG_FH.write(json.dumps(log_entry, separators=_JSON_SEPARATORS) + '\n')
             
     except Exception as e:
         print(f"⚠️ Could not save log: {e}")
         # Try to create a backup
         try:
-            backup_file = log_file + '.backup'
-            with open(backup_file, 'w') as f:
-                json.dump([log_entry], f, indent=2)
+            backup_file = _LOG_PATH + '.backup'
+            with open(backup_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(log_entry, separators=_JSON_SEPARATORS) + '\n')
             print(f"📝 Log saved to backup: {backup_file}")
         except:
             pass
@@ -254,11 +375,9 @@ def main():
             
             # Generate and print response for GitHub Copilot
             response = generate_response(action, processed_input)
-            print("\n" + "="*50)
-            print("📤 RESPONSE FOR GITHUB COPILOT:")
-            print("="*50)
-            print(response)
-            print("="*50)
+            # One write plus flush so a piped reader sees the whole block at once
+            sys.stdout.write(RESPONSE_TEMPLATE.format(response=response))
+            sys.stdout.flush()
             
             # Exit after providing response - Copilot will run this script again
             break
@@ -5,245 +5,197 @@ No timeouts - window stays open until user action
 """
 import sys
 import os
+import json
+from functools import partialmethod
+from types import SimpleNamespace
 
 # Try ttkbootstrap first, fallback to tkinter
 try:
     import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
     from ttkbootstrap.scrolled import ScrolledText
     TTK_AVAILABLE = True
 except ImportError:
     import tkinter as tk
-    from tkinter import ttk, scrolledtext
+    from tkinter import scrolledtext
     TTK_AVAILABLE = False
 
-from tkinter import messagebox
+# Text indices; the string forms work for ttkbootstrap and tkinter alike
+_INSERT = "insert"
+_LINE_START = "insert linestart"
+_END = "end"
+
+# Window size, fixed at creation so centering never needs a layout pass
+_WIDTH, _HEIGHT = 900, 700
+
+# Screen size, queried from Tk on first centering and reused afterwards
+_SCREEN_SIZE = None
+
+def _screen_size(root):
+    """Return (width, height) of the screen, asking Tk only once per process"""
+    global _SCREEN_SIZE
+    if _SCREEN_SIZE is None:
+        _SCREEN_SIZE = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return _SCREEN_SIZE
+
+_TITLE = "GitHub Copilot - Continuous Flow Instructions"
+
+# Widget classes and per-role options for the available backend; the window
+# layout itself lives in StandaloneGUI._build and is shared by both
+if TTK_AVAILABLE:
+    _UI = SimpleNamespace(
+        window=lambda: ttk.Window(title=_TITLE, themename="darkly", size=(_WIDTH, _HEIGHT)),
+        Frame=ttk.Frame,
+        Label=ttk.Label,
+        Button=ttk.Button,
+        ScrolledText=ScrolledText,
+        font='Segoe UI',
+        main_frame={'padding': 20},
+        frame={},
+        title={'bootstyle': "info"},
+        muted={'bootstyle': "secondary"},
+        toolbar_button=lambda style, side: {'bootstyle': style, 'width': 12 if side == 'left' else 10},
+        submit={'bootstyle': "success", 'width': 30},
+        cancel={'bootstyle': "danger", 'width': 20},
+        text={},
+        # ttkbootstrap's ScrolledText is a frame; options go to its inner Text
+        inner_text=lambda area: area.text,
+    )
+else:
+    # Dark theme colors
+    _BG = '#2b2b2b'
+    _FG = '#ffffff'
+    _ENTRY_BG = '#3c3c3c'
+    _BUTTON_BG = '#404040'
+    _MUTED_FG = '#cccccc'
+    
+    def _tk_window():
+        """Create the plain tkinter root window with the dark background"""
+        root = tk.Tk()
+        root.title(_TITLE)
+        root.geometry(f"{_WIDTH}x{_HEIGHT}")
+        root.configure(bg=_BG)
+        return root
+    
+    _UI = SimpleNamespace(
+        window=_tk_window,
+        Frame=tk.Frame,
+        Label=tk.Label,
+        Button=tk.Button,
+        ScrolledText=scrolledtext.ScrolledText,
+        font='Arial',
+        main_frame={'bg': _BG, 'padx': 20, 'pady': 20},
+        frame={'bg': _BG},
+        title={'fg': '#4CAF50', 'bg': _BG},
+        muted={'fg': _MUTED_FG, 'bg': _BG},
+        toolbar_button=lambda style, side: {'bg': _BUTTON_BG, 'fg': _FG, 'relief': 'flat', 'padx': 10, 'pady': 5},
+        submit={'bg': '#4CAF50', 'fg': 'white', 'font': ('Arial', 10, 'bold'), 'padx': 20, 'pady': 8},
+        cancel={'bg': '#f44336', 'fg': 'white', 'font': ('Arial', 10, 'bold'), 'padx': 20, 'pady': 8},
+        text={'bg': _ENTRY_BG, 'fg': _FG, 'insertbackground': _FG},
+        inner_text=lambda area: area,
+    )
 
 class StandaloneGUI:
-    def __init__(self, initial_text=""):
+    # Toolbar buttons as (label, method name, ttkbootstrap style, toolbar side)
+    _TOOLBAR = (
+        ("• Bullet", "add_bullet", "outline-secondary", "left"),
+        ("1. Number", "add_number", "outline-secondary", "left"),
+        ("→ Subitem", "add_subitem", "outline-secondary", "left"),
+        ("☐ Checkbox", "add_checkbox", "outline-secondary", "left"),
+        ("--- Sep", "add_separator", "outline-warning", "right"),
+        ("🗑️ Clear", "clear_text", "outline-danger", "right"),
+    )
+    
+    def __init__(self, initial_text="", persistent=False):
         self.initial_text = initial_text
         self.result = None
+        # When persistent, submit/cancel hide the window for the next request
+        self.persistent = persistent
         
-        if TTK_AVAILABLE:
-            self.setup_modern_gui()
-        else:
-            self.setup_fallback_gui()
-    
-    def setup_modern_gui(self):
-        """Setup modern ttkbootstrap GUI"""
-        import ttkbootstrap as ttk
-        
-        self.root = ttk.Window(
-            title="GitHub Copilot - Continuous Flow Instructions",
-            themename="darkly",
-            size=(900, 700)
-        )
-        
-        # Make window stay on top
-        self.root.attributes('-topmost', True)
-        
-        # Main container
-        main_frame = ttk.Frame(self.root, padding=20)
-        main_frame.pack(fill=BOTH, expand=True)
-        
-        # Title
-        title_label = ttk.Label(
-            main_frame, 
-            text="📝 Continuous Flow Instructions",
-            font=('Segoe UI', 16, 'bold'),
-            bootstyle="info"
-        )
-        title_label.pack(pady=(0, 10))
-        
-        # Subtitle
-        subtitle_label = ttk.Label(
-            main_frame,
-            text="Enter your instructions below. This window will stay open until you submit or cancel.",
-            font=('Segoe UI', 10),
-            bootstyle="secondary"
-        )
-        subtitle_label.pack(pady=(0, 15))
-        
-        # Toolbar frame
-        toolbar_frame = ttk.Frame(main_frame)
-        toolbar_frame.pack(fill=X, pady=(0, 10))
-        
-        # Left toolbar
-        left_toolbar = ttk.Frame(toolbar_frame)
-        left_toolbar.pack(side=LEFT)
-        
-        # Formatting buttons
-        ttk.Button(left_toolbar, text="• Bullet", command=self.add_bullet, bootstyle="outline-secondary", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(left_toolbar, text="1. Number", command=self.add_number, bootstyle="outline-secondary", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(left_toolbar, text="→ Subitem", command=self.add_subitem, bootstyle="outline-secondary", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(left_toolbar, text="☐ Checkbox", command=self.add_checkbox, bootstyle="outline-secondary", width=12).pack(side=LEFT, padx=(0, 5))
-        
-        # Right toolbar
-        right_toolbar = ttk.Frame(toolbar_frame)
-        right_toolbar.pack(side=RIGHT)
-        
-        ttk.Button(right_toolbar, text="--- Sep", command=self.add_separator, bootstyle="outline-warning", width=10).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(right_toolbar, text="🗑️ Clear", command=self.clear_text, bootstyle="outline-danger", width=10).pack(side=LEFT)
-        
-        # Text area with instructions template
-        self.text_area = ScrolledText(
-            main_frame,
-            height=20,
-            font=('Consolas', 11),
-            wrap='word'
-        )
-        self.text_area.pack(fill=BOTH, expand=True, pady=(0, 15))
-        
-        # Add initial text if provided, otherwise start blank
-        if self.initial_text:
-            self.text_area.insert("1.0", self.initial_text)
-        
-        # Button frame
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=X, pady=(0, 10))
-        
-        ttk.Button(button_frame, text="✅ Submit Instructions (Ctrl+Enter)", command=self.submit, bootstyle="success", width=30).pack(side=LEFT, padx=(0, 10))
-        ttk.Button(button_frame, text="❌ Cancel (Esc)", command=self.cancel, bootstyle="danger", width=20).pack(side=LEFT)
-        
-        # Status with continuous flow note
-        self.status_label = ttk.Label(
-            main_frame,
-            text="💡 No timeout - Take your time | Shortcuts: Ctrl+Enter (Submit) | Escape (Cancel) | Ctrl+L (Clear)",
-            font=('Segoe UI', 9),
-            bootstyle="secondary"
-        )
-        self.status_label.pack()
-        
-        # Bindings
-        self.root.bind('<Control-Return>', lambda e: self.submit())
-        self.root.bind('<Escape>', lambda e: self.cancel())
-        self.root.bind('<Control-l>', lambda e: self.clear_text())
-        self.root.protocol("WM_DELETE_WINDOW", self.cancel)
+        # Formatting markers waiting for the next idle tick
+        self._pending = []
+        self._scheduled = False
         
-        self.text_area.focus_set()
-        self.center_window()
+        self._build(_UI)
     
-    def setup_fallback_gui(self):
-        """Setup fallback tkinter GUI with dark styling"""
-        import tkinter as tk
-        from tkinter import scrolledtext
-        
-        self.root = tk.Tk()
-        self.root.title("GitHub Copilot - Continuous Flow Instructions")
-        self.root.geometry("900x700")
+    def _build(self, ui):
+        """Build the editor window from the widget factories in ui"""
+        self.root = ui.window()
         
         # Make window stay on top
         self.root.attributes('-topmost', True)
         
-        # Dark theme colors
-        bg_color = '#2b2b2b'
-        fg_color = '#ffffff'
-        entry_bg = '#3c3c3c'
-        button_bg = '#404040'
-        
-        self.root.configure(bg=bg_color)
-        
-        # Main frame
-        main_frame = tk.Frame(self.root, bg=bg_color, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        # Main container
+        main_frame = ui.Frame(self.root, **ui.main_frame)
+        main_frame.pack(fill='both', expand=True)
         
         # Title
-        title_label = tk.Label(
+        title_label = ui.Label(
             main_frame,
             text="📝 Continuous Flow Instructions",
-            font=('Arial', 16, 'bold'),
-            fg='#4CAF50', bg=bg_color
+            font=(ui.font, 16, 'bold'),
+            **ui.title
         )
         title_label.pack(pady=(0, 10))
         
         # Subtitle
-        subtitle_label = tk.Label(
+        subtitle_label = ui.Label(
             main_frame,
             text="Enter your instructions below. This window will stay open until you submit or cancel.",
-            font=('Arial', 10),
-            fg='#cccccc', bg=bg_color
+            font=(ui.font, 10),
+            **ui.muted
         )
         subtitle_label.pack(pady=(0, 15))
         
-        # Toolbar
-        toolbar_frame = tk.Frame(main_frame, bg=bg_color)
-        toolbar_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Buttons
-        buttons = [
-            ("• Bullet", self.add_bullet),
-            ("1. Number", self.add_number),
-            ("→ Subitem", self.add_subitem),
-            ("☐ Checkbox", self.add_checkbox),
-            ("--- Sep", self.add_separator),
-            ("🗑️ Clear", self.clear_text)
-        ]
-        
-        for text, command in buttons:
-            btn = tk.Button(
-                toolbar_frame,
+        # Toolbar frame
+        toolbar_frame = ui.Frame(main_frame, **ui.frame)
+        toolbar_frame.pack(fill='x', pady=(0, 10))
+        
+        # Left toolbar holds the list markers, right toolbar the rest
+        left_toolbar = ui.Frame(toolbar_frame, **ui.frame)
+        left_toolbar.pack(side='left')
+        right_toolbar = ui.Frame(toolbar_frame, **ui.frame)
+        right_toolbar.pack(side='right')
+        
+        # Toolbar buttons - takefocus=False keeps the cursor in the text area
+        toolbars = {'left': left_toolbar, 'right': right_toolbar}
+        for text, command, style, side in self._TOOLBAR:
+            ui.Button(
+                toolbars[side],
                 text=text,
-                command=command,
-                bg=button_bg,
-                fg=fg_color,
-                relief=tk.FLAT,
-                padx=10,
-                pady=5
-            )
-            btn.pack(side=tk.LEFT, padx=(0, 5))
+                command=getattr(self, command),
+                takefocus=False,
+                **ui.toolbar_button(style, side)
+            ).pack(side='left', padx=(0, 5))
         
         # Text area
-        self.text_area = scrolledtext.ScrolledText(
+        self.text_area = ui.ScrolledText(
             main_frame,
             height=20,
             font=('Consolas', 11),
-            bg=entry_bg,
-            fg=fg_color,
-            insertbackground=fg_color,
-            wrap=tk.WORD
+            wrap='word',
+            **ui.text
         )
-        self.text_area.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        self.text_area.pack(fill='both', expand=True, pady=(0, 15))
+        self._text_widget = ui.inner_text(self.text_area)
         
         # Add initial text if provided, otherwise start blank
-        if self.initial_text:
-            self.text_area.insert(1.0, self.initial_text)
+        self.load_text(self.initial_text)
         
-        # Buttons
-        button_frame = tk.Frame(main_frame, bg=bg_color)
-        button_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        submit_btn = tk.Button(
-            button_frame,
-            text="✅ Submit Instructions (Ctrl+Enter)",
-            command=self.submit,
-            bg='#4CAF50',
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            padx=20,
-            pady=8
-        )
-        submit_btn.pack(side=tk.LEFT, padx=(0, 10))
+        # Button frame
+        button_frame = ui.Frame(main_frame, **ui.frame)
+        button_frame.pack(fill='x', pady=(0, 10))
         
-        cancel_btn = tk.Button(
-            button_frame,
-            text="❌ Cancel (Esc)",
-            command=self.cancel,
-            bg='#f44336',
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            padx=20,
-            pady=8
-        )
-        cancel_btn.pack(side=tk.LEFT)
+        ui.Button(button_frame, text="✅ Submit Instructions (Ctrl+Enter)", command=self.submit, **ui.submit).pack(side='left', padx=(0, 10))
+        ui.Button(button_frame, text="❌ Cancel (Esc)", command=self.cancel, **ui.cancel).pack(side='left')
         
-        # Status
-        status_label = tk.Label(
+        # Status with continuous flow note
+        self.status_label = ui.Label(
             main_frame,
             text="💡 No timeout - Take your time | Shortcuts: Ctrl+Enter (Submit) | Escape (Cancel) | Ctrl+L (Clear)",
-            font=('Arial', 9),
-            fg='#cccccc', bg=bg_color
+            font=(ui.font, 9),
+            **ui.muted
         )
-        status_label.pack(pady=(10, 0))
+        self.status_label.pack(pady=(10, 0))
         
         # Bindings
         self.root.bind('<Control-Return>', lambda e: self.submit())
@@ -256,138 +208,111 @@ class StandaloneGUI:
     
     def center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        # The size is known up front, so only the screen needs querying
+        screen_w, screen_h = _screen_size(self.root)
+        x = (screen_w - _WIDTH) // 2
+        y = (screen_h - _HEIGHT) // 2
+        self.root.geometry(f"{_WIDTH}x{_HEIGHT}+{x}+{y}")
     
-    # Formatting methods
-    def add_bullet(self):
-        if TTK_AVAILABLE:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "• ")
-        else:
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "\n• ")
-        self.text_area.focus_set()
+    def load_text(self, text):
+        """Replace the editor contents with text"""
+        self.initial_text = text
+        # Markers queued for the previous contents no longer apply
+        self._pending = []
+        self.text_area.delete("1.0", _END)
+        if text:
+            # Insert unwrapped so Tk reflows once, when wrapping is restored
+            self._text_widget.configure(wrap='none')
+            self.text_area.insert("1.0", text)
+            self._text_widget.configure(wrap='word')
     
-    def add_number(self):
-        if TTK_AVAILABLE:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "1. ")
-        else:
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "\n1. ")
-        self.text_area.focus_set()
+    # Formatting methods
+    def _insert_marker(self, marker):
+        """Queue marker for insertion at the cursor on the next idle tick"""
+        self._pending.append(marker)
+        if not self._scheduled:
+            self._scheduled = True
+            self.text_area.after_idle(self._flush_markers)
     
-    def add_subitem(self):
-        if TTK_AVAILABLE:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "  → ")
-        else:
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "\n  → ")
-        self.text_area.focus_set()
+    def _flush_markers(self):
+        """Insert queued markers with one call, each on a new line unless the current one is blank"""
+        markers, self._pending = self._pending, []
+        self._scheduled = False
+        # Tk resolves "linestart" itself, so this is a single round-trip
+        line = self.text_area.get(_LINE_START, _INSERT)
+        chunks = []
+        for marker in markers:
+            chunk = ("\n" if line.strip() else "") + marker
+            chunks.append(chunk)
+            line = (line + chunk).rpartition("\n")[2]
+        self.text_area.insert(_INSERT, "".join(chunks))
     
-    def add_checkbox(self):
-        if TTK_AVAILABLE:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "☐ ")
-        else:
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "\n☐ ")
-        self.text_area.focus_set()
-    
-    def add_separator(self):
-        if TTK_AVAILABLE:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        separator = "---"
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, separator + "\n")
-        else:
-            self.text_area.insert("insert" if TTK_AVAILABLE else tk.INSERT, "\n" + separator + "\n")
-        self.text_area.focus_set()
+    add_bullet = partialmethod(_insert_marker, "• ")
+    add_number = partialmethod(_insert_marker, "1. ")
+    add_subitem = partialmethod(_insert_marker, "  → ")
+    add_checkbox = partialmethod(_insert_marker, "☐ ")
+    add_separator = partialmethod(_insert_marker, "---\n")
     
     def clear_text(self):
+        # Nothing to clear - don't ask
+        if not self.text_area.count("1.0", "end-1c", "chars"):
+            return
+        from tkinter import messagebox
         if messagebox.askquestion("Clear Text", "Are you sure you want to clear all text?") == 'yes':
-            if TTK_AVAILABLE:
-                self.text_area.delete("1.0", "end")
-            else:
-                import tkinter as tk
-                self.text_area.delete(1.0, tk.END)
+            self.text_area.delete("1.0", _END)
             self.text_area.focus_set()
     
     def submit(self):
-        if TTK_AVAILABLE:
-            content = self.text_area.get("1.0", "end-1c").strip()
-        else:
-            import tkinter as tk
-            content = self.text_area.get(1.0, tk.END).strip()
+        # count() is falsy for an empty editor, which skips copying the text
+        content = self.text_area.count("1.0", "end-1c", "chars") and self.text_area.get("1.0", "end-1c").strip()
         
         if not content:
+            # Dialogs are rare, so messagebox is only imported when needed
+            from tkinter import messagebox
             messagebox.showwarning("Empty Content", "Please enter some instructions.")
             return
         
-        # Print result to stdout so parent process can capture it
-        print("GUI_RESULT_START")
-        print(content)
-        print("GUI_RESULT_END")
-        
-        self.root.quit()
-        self.root.destroy()
+        # Write result to stdout so parent process can capture it - one
+        # write plus flush so the parent reads the whole block at once
+        sys.stdout.write(f"GUI_RESULT_START\n{content}\nGUI_RESULT_END\n")
+        sys.stdout.flush()
+        self._close()
     
     def cancel(self):
-        print("GUI_RESULT_CANCELLED")
-        self.root.quit()
-        self.root.destroy()
+        sys.stdout.write("GUI_RESULT_CANCELLED\n")
+        sys.stdout.flush()
+        self._close()
+    
+    def _close(self):
+        """Hide the window when serving, otherwise destroy it"""
+        if self.persistent:
+            # quit() ends this mainloop() but keeps the window for reuse
+            self.root.withdraw()
+            self.root.quit()
+        else:
+            # destroy() also ends mainloop(), so run() returns straight away
+            self.root.destroy()
     
     def run(self):
         """Run the GUI - no timeout, stays open until user action"""
         self.root.mainloop()
+    
+    def serve(self):
+        """Answer JSON-line requests from stdin, reusing this window for each one"""
+        self.root.withdraw()
+        for line in sys.stdin:
+            self.load_text(json.loads(line).get("text", ""))
+            self.root.deiconify()
+            self.text_area.focus_set()
+            self.run()
+        # flow.py closed the pipe - its session is over
+        self.root.destroy()
 
 if __name__ == "__main__":
-    initial_text = sys.argv[1] if len(sys.argv) > 1 else ""
-    gui = StandaloneGUI(initial_text)
-    gui.run()
\ No newline at end of file
+    if sys.argv[1:] == ["--serve"]:
+        # Long-lived mode: one window, many edits, requests on stdin
+        StandaloneGUI(persistent=True).serve()
+    else:
+        initial_text = sys.argv[1] if len(sys.argv) > 1 else ""
+        gui = StandaloneGUI(initial_text)
+        gui.run()
\ No newline at end of file
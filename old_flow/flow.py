@@ -11,44 +11,86 @@ import sys
 import os
 from datetime import datetime
 import json
+import re
+import subprocess
 import threading
-import queue
-from tkinter import messagebox
+import importlib.util
+from functools import partial
+from tkinter import TclError, messagebox
 
 try:
     import ttkbootstrap as ttk
     from ttkbootstrap.constants import *
     from ttkbootstrap.scrolled import ScrolledText
     TTK_AVAILABLE = True
-    print("✅ ttkbootstrap available - Using modern UI")
 except ImportError:
     import tkinter as tk
     from tkinter import ttk, scrolledtext
     TTK_AVAILABLE = False
-    print("⚠️  ttkbootstrap not available - Using standard tkinter")
-    print("💡 Install with: pip install ttkbootstrap")
+
+# Paths resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_GUI_HELPER_PATH = os.path.join(_MODULE_DIR, 'gui_helper.py')
+_LOG_PATH = os.path.join(_MODULE_DIR, 'session_log.jsonl')
+_LEGACY_LOG_PATH = os.path.join(_MODULE_DIR, 'session_log.json')
+
+# Standalone finish words and GUI triggers recognised in user input
+_FINISH_RE = re.compile(r'\b(?:done|finish)\b')
+_GUI_KEYWORDS = frozenset(('gui', 'edit', 'editor'))
+
+# Default status bar text, restored after transient messages
+_SHORTCUTS_TEXT = "💡 Shortcuts: Ctrl+Enter (Submit) | Escape (Cancel) | Ctrl+L (Clear)"
+
+# Prefix of the single JSON result line printed by gui_helper.py
+GUI_RESULT_PREFIX = "FLOW_RESULT:"
+GUI_TIMEOUT = 300  # 5 minute timeout for the GUI editor
+
+# Set once the backend notice has been shown, so it appears at most once per run
+_BACKEND_REPORTED = False
+
+# Backend resolved once at import and reused by every InstructionGUI
+_TTK = ttk if TTK_AVAILABLE else None
+_ScrolledText = ScrolledText if TTK_AVAILABLE else scrolledtext.ScrolledText
 
 class InstructionGUI:
     """Modern GUI for entering detailed instructions using ttkbootstrap"""
     
-    def __init__(self, initial_text="", result_queue=None):
-        self.result_queue = result_queue
+    # Formatting buttons: name -> (prefix, trailing text)
+    _PREFIXES = {
+        "bullet": ("• ", ""),
+        "number": ("1. ", ""),
+        "subitem": ("  → ", ""),
+        "separator": ("---", "\n"),
+        "checkbox": ("☐ ", ""),
+    }
+    
+    # Formatting toolbar rows: (label, _PREFIXES key, ttkbootstrap style, tkinter colour)
+    _FORMAT_ROWS = (
+        (("• Bullet", "bullet", "info-outline", '#3498db'),
+         ("1. Number", "number", "info-outline", '#3498db'),
+         ("→ Sub-item", "subitem", "secondary-outline", '#9b59b6')),
+        (("--- Separator", "separator", "secondary-outline", '#95a5a6'),
+         ("✓ Checkbox", "checkbox", "success-outline", '#27ae60')),
+    )
+    
+    def __init__(self, initial_text=""):
         self.result = None
         self.window_closed = False
+        # Text index for the cursor; the string form works for both backends
+        self._INSERT = "insert"
+        # Pending after() id that restores the status bar text
+        self._status_reset = None
         
-        # Check ttkbootstrap availability for this instance
-        self.ttk_available = self._check_ttkbootstrap()
+        self.ttk_available = TTK_AVAILABLE
         
         if self.ttk_available:
-            import ttkbootstrap as ttk
-            self.root = ttk.Window(
+            self.root = _TTK.Window(
                 title="GitHub Copilot - Detailed Instructions",
                 themename="darkly",  # Modern dark theme
                 size=(800, 600),
                 resizable=(True, True)
             )
         else:
-            import tkinter as tk
             self.root = tk.Tk()
             self.root.title("GitHub Copilot - Detailed Instructions") 
             self.root.geometry("800x600")
@@ -56,14 +98,6 @@ class InstructionGUI:
             
         self.setup_gui(initial_text)
     
-    def _check_ttkbootstrap(self):
-        """Check if ttkbootstrap is available for this instance"""
-        try:
-            import ttkbootstrap
-            return True
-        except ImportError:
-            return False
-        
     def setup_gui(self, initial_text):
         """Setup the modern GUI components"""
         
@@ -76,23 +110,19 @@ class InstructionGUI:
     
     def setup_modern_gui(self, initial_text):
         """Setup modern ttkbootstrap GUI"""
-        import ttkbootstrap as ttk
-        from ttkbootstrap.constants import BOTH, X, LEFT, RIGHT
-        from ttkbootstrap.scrolled import ScrolledText
-        
         # Make window stay on top
         self.root.attributes('-topmost', True)
         
         # Main container with padding
-        main_container = ttk.Frame(self.root, padding=20)
+        main_container = _TTK.Frame(self.root, padding=20)
         main_container.pack(fill=BOTH, expand=True)
         
         # Header section with modern styling
-        header_frame = ttk.Frame(main_container)
+        header_frame = _TTK.Frame(main_container)
         header_frame.pack(fill=X, pady=(0, 20))
         
         # Title with modern typography
-        title_label = ttk.Label(
+        title_label = _TTK.Label(
             header_frame,
             text="📝 GitHub Copilot - Detailed Instructions",
             font=('Segoe UI', 16, 'bold'),
@@ -101,7 +131,7 @@ class InstructionGUI:
         title_label.pack()
         
         # Subtitle
-        subtitle_label = ttk.Label(
+        subtitle_label = _TTK.Label(
             header_frame,
             text="Write your detailed instructions below. Use the formatting buttons for better structure.",
             font=('Segoe UI', 10),
@@ -110,69 +140,59 @@ class InstructionGUI:
         subtitle_label.pack(pady=(5, 0))
         
         # Modern toolbar with grouped buttons
-        toolbar_frame = ttk.Frame(main_container)
+        toolbar_frame = _TTK.Frame(main_container)
         toolbar_frame.pack(fill=X, pady=(0, 15))
         
         # Formatting button group
-        format_group = ttk.LabelFrame(toolbar_frame, text="Formatting", padding=10, bootstyle="primary")
+        format_group = _TTK.LabelFrame(toolbar_frame, text="Formatting", padding=10, bootstyle="primary")
         format_group.pack(side=LEFT, fill='y', padx=(0, 10))
         
-        # Row 1 of formatting buttons
-        format_row1 = ttk.Frame(format_group)
-        format_row1.pack(fill=X, pady=(0, 5))
-        
-        ttk.Button(format_row1, text="• Bullet", command=self.add_bullet, 
-                  bootstyle="info-outline", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(format_row1, text="1. Number", command=self.add_number, 
-                  bootstyle="info-outline", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(format_row1, text="→ Sub-item", command=self.add_subitem, 
-                  bootstyle="secondary-outline", width=12).pack(side=LEFT)
-        
-        # Row 2 of formatting buttons
-        format_row2 = ttk.Frame(format_group)
-        format_row2.pack(fill=X)
-        
-        ttk.Button(format_row2, text="--- Separator", command=self.add_separator, 
-                  bootstyle="secondary-outline", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(format_row2, text="✓ Checkbox", command=self.add_checkbox, 
-                  bootstyle="success-outline", width=12).pack(side=LEFT, padx=(0, 5))
-        ttk.Button(format_row2, text="🗑️ Clear", command=self.clear_text, 
+        # Formatting buttons, one frame per row; Clear ends the last row
+        for pady, buttons in zip(((0, 5), 0), self._FORMAT_ROWS):
+            row = _TTK.Frame(format_group)
+            row.pack(fill=X, pady=pady)
+            for label, key, style, _colour in buttons:
+                _TTK.Button(row, text=label, command=partial(self._insert_formatted, *self._PREFIXES[key]),
+                          bootstyle=style, width=12).pack(side=LEFT, padx=(0, 5))
+        _TTK.Button(row, text="🗑️ Clear", command=self.clear_text, 
                   bootstyle="danger-outline", width=12).pack(side=LEFT)
         
         # Action button group
-        action_group = ttk.LabelFrame(toolbar_frame, text="Actions", padding=10, bootstyle="success")
+        action_group = _TTK.LabelFrame(toolbar_frame, text="Actions", padding=10, bootstyle="success")
         action_group.pack(side=RIGHT, fill='y')
         
-        ttk.Button(action_group, text="✅ Add to Terminal", command=self.add_to_terminal,
+        _TTK.Button(action_group, text="✅ Add to Terminal", command=self.add_to_terminal,
                   bootstyle="success", width=16).pack(pady=(0, 5))
-        ttk.Button(action_group, text="❌ Cancel", command=self.cancel,
+        _TTK.Button(action_group, text="❌ Cancel", command=self.cancel,
                   bootstyle="danger", width=16).pack()
         
         # Text area with modern styling
-        text_frame = ttk.Frame(main_container)
+        text_frame = _TTK.Frame(main_container)
         text_frame.pack(fill=BOTH, expand=True, pady=(0, 15))
         
         # Modern scrolled text area
-        self.text_area = ScrolledText(
+        self.text_area = _ScrolledText(
             text_frame,
             wrap="word",
             height=20,
             font=('Consolas', 11),
-            bootstyle="secondary"
+            bootstyle="secondary",
+            undo=True
         )
         self.text_area.pack(fill=BOTH, expand=True)
         
-        # Insert initial text if provided
+        # Insert initial text if provided; it is not something Ctrl+Z should remove
         if initial_text:
             self.text_area.insert("1.0", initial_text)
+            self.text_area.edit_reset()
             
         # Modern status bar
-        status_frame = ttk.Frame(main_container)
+        status_frame = _TTK.Frame(main_container)
         status_frame.pack(fill=X)
         
-        self.status_label = ttk.Label(
+        self.status_label = _TTK.Label(
             status_frame,
-            text="💡 Shortcuts: Ctrl+Enter (Submit) | Escape (Cancel) | Ctrl+L (Clear)",
+            text=_SHORTCUTS_TEXT,
             font=('Segoe UI', 9),
             bootstyle="secondary"
         )
@@ -194,9 +214,6 @@ class InstructionGUI:
     
     def setup_fallback_gui(self, initial_text):
         """Fallback GUI using standard tkinter"""
-        import tkinter as tk
-        from tkinter import scrolledtext
-        
         # Configure colors for fallback
         bg_color = '#2b2b2b'
         fg_color = '#ffffff'
@@ -224,40 +241,30 @@ class InstructionGUI:
         toolbar_frame = tk.Frame(main_frame, bg=bg_color)
         toolbar_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Formatting buttons - Row 1
-        button_row1 = tk.Frame(toolbar_frame, bg=bg_color)
-        button_row1.pack(fill=tk.X, pady=(0, 5))
-        
-        tk.Button(button_row1, text="• Bullet", command=self.add_bullet, 
-                 bg='#3498db', fg='white', width=12).pack(side=tk.LEFT, padx=2)
-        tk.Button(button_row1, text="1. Number", command=self.add_number, 
-                 bg='#3498db', fg='white', width=12).pack(side=tk.LEFT, padx=2)
-        tk.Button(button_row1, text="→ Sub-item", command=self.add_subitem, 
-                 bg='#9b59b6', fg='white', width=12).pack(side=tk.LEFT, padx=2)
-        
-        # Formatting buttons - Row 2
-        button_row2 = tk.Frame(toolbar_frame, bg=bg_color)
-        button_row2.pack(fill=tk.X)
-        
-        tk.Button(button_row2, text="--- Separator", command=self.add_separator, 
-                 bg='#95a5a6', fg='white', width=12).pack(side=tk.LEFT, padx=2)
-        tk.Button(button_row2, text="✓ Checkbox", command=self.add_checkbox, 
-                 bg='#27ae60', fg='white', width=12).pack(side=tk.LEFT, padx=2)
-        tk.Button(button_row2, text="🗑️ Clear", command=self.clear_text, 
+        # Formatting buttons, one frame per row; Clear ends the last row
+        for pady, buttons in zip(((0, 5), 0), self._FORMAT_ROWS):
+            row = tk.Frame(toolbar_frame, bg=bg_color)
+            row.pack(fill=tk.X, pady=pady)
+            for label, key, _style, colour in buttons:
+                tk.Button(row, text=label, command=partial(self._insert_formatted, *self._PREFIXES[key]), 
+                         bg=colour, fg='white', width=12).pack(side=tk.LEFT, padx=2)
+        tk.Button(row, text="🗑️ Clear", command=self.clear_text, 
                  bg='#e74c3c', fg='white', width=12).pack(side=tk.LEFT, padx=2)
         
         # Text area
-        self.text_area = scrolledtext.ScrolledText(main_frame, 
-                                                  wrap=tk.WORD, 
-                                                  height=18,
-                                                  font=('Consolas', 11),
-                                                  bg='#1e1e1e', fg=fg_color,
-                                                  insertbackground='#3498db',
-                                                  selectbackground='#4a4a4a')
+        self.text_area = _ScrolledText(main_frame, 
+                                       wrap=tk.WORD, 
+                                       height=18,
+                                       font=('Consolas', 11),
+                                       bg='#1e1e1e', fg=fg_color,
+                                       insertbackground='#3498db',
+                                       selectbackground='#4a4a4a',
+                                       undo=True)
         self.text_area.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         if initial_text:
             self.text_area.insert(tk.END, initial_text)
+            self.text_area.edit_reset()
             
         # Action buttons
         button_frame = tk.Frame(main_frame, bg=bg_color)
@@ -271,11 +278,11 @@ class InstructionGUI:
                  padx=20, pady=8).pack(side=tk.RIGHT)
         
         # Status bar
-        status_label = tk.Label(main_frame,
-                               text="💡 Shortcuts: Ctrl+Enter (Submit) | Escape (Cancel) | Ctrl+L (Clear)",
-                               font=('Arial', 9),
-                               fg='#cccccc', bg=bg_color)
-        status_label.pack(pady=(10, 0))
+        self.status_label = tk.Label(main_frame,
+                                     text=_SHORTCUTS_TEXT,
+                                     font=('Arial', 9),
+                                     fg='#cccccc', bg=bg_color)
+        self.status_label.pack(pady=(10, 0))
         
         # Set window close protocol
         self.root.protocol("WM_DELETE_WINDOW", self.cancel)
@@ -288,106 +295,34 @@ class InstructionGUI:
         self.text_area.focus_set()
         self.center_window()
         
-    def add_bullet(self):
-        """Insert bullet point"""
-        if self.ttk_available:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "• ")
-        else:
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "\n• ")
-        self.text_area.focus_set()
-        
-    def add_number(self):
-        """Insert numbered list item"""
-        if self.ttk_available:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
+    def _insert_formatted(self, prefix, trailing=""):
+        """Queue a formatting marker; Tk applies it with the focus change in one idle pass"""
+        self.text_area.after_idle(self._apply_formatted, prefix + trailing)
         
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "1. ")
-        else:
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "\n1. ")
+    def _apply_formatted(self, marker):
+        """Insert marker at the cursor, starting a new line unless the current one is blank"""
+        blank = not self.text_area.get(self._INSERT + " linestart", self._INSERT).strip()
+        self.text_area.insert(self._INSERT, marker if blank else "\n" + marker)
         self.text_area.focus_set()
         
-    def add_subitem(self):
-        """Insert sub-item"""
-        if self.ttk_available:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "  → ")
-        else:
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "\n  → ")
-        self.text_area.focus_set()
-        
-    def add_separator(self):
-        """Insert separator line"""
-        if self.ttk_available:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        separator = "---"
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, separator + "\n")
-        else:
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "\n" + separator + "\n")
-        self.text_area.focus_set()
-        
-    def add_checkbox(self):
-        """Insert checkbox item"""
-        if self.ttk_available:
-            cursor_pos = self.text_area.index("insert")
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        else:
-            import tkinter as tk
-            cursor_pos = self.text_area.index(tk.INSERT)
-            line_start = cursor_pos.split('.')[0] + '.0'
-            line_content = self.text_area.get(line_start, cursor_pos)
-        
-        if line_content.strip() == '':
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "☐ ")
-        else:
-            self.text_area.insert("insert" if self.ttk_available else tk.INSERT, "\n☐ ")
+    def clear_text(self):
+        """Clear all text as one step of the widget's undo history (Ctrl+Z restores it)"""
+        if self.text_area.compare("end-1c", "==", "1.0"):
+            return  # Nothing to clear
+        self.text_area.edit_separator()
+        self.text_area.delete("1.0", "end")
+        self.text_area.edit_separator()
+        self.status_label.configure(text="🗑️ Cleared - Ctrl+Z to undo")
+        # Restart the countdown so repeated clears each get the full 3 seconds
+        if self._status_reset is not None:
+            self.root.after_cancel(self._status_reset)
+        self._status_reset = self.root.after(3000, self._reset_status)
         self.text_area.focus_set()
         
-    def clear_text(self):
-        """Clear all text"""
-        if messagebox.askquestion("Clear Text", "Are you sure you want to clear all text?") == 'yes':
-            if self.ttk_available:
-                self.text_area.delete("1.0", "end")
-            else:
-                import tkinter as tk
-                self.text_area.delete(1.0, tk.END)
-            self.text_area.focus_set()
+    def _reset_status(self):
+        """Put the shortcuts back in the status bar"""
+        self._status_reset = None
+        self.status_label.configure(text=_SHORTCUTS_TEXT)
         
     def center_window(self):
         """Center the window on screen"""
@@ -400,72 +335,34 @@ class InstructionGUI:
         
     def add_to_terminal(self):
         """Add content to terminal and close GUI"""
-        if self.ttk_available:
-            content = self.text_area.get("1.0", "end-1c").strip()
-        else:
-            import tkinter as tk
-            content = self.text_area.get(1.0, tk.END).strip()
+        content = self.text_area.get("1.0", "end-1c").strip()
             
         if not content:
             messagebox.showwarning("Empty Content", "Please enter some instructions before adding to terminal.")
             return
             
         self.result = content
-        if self.result_queue:
-            self.result_queue.put(content)
         
         self.cleanup()
         
     def cancel(self):
         """Cancel GUI and close window"""
         self.result = None
-        if self.result_queue:
-            self.result_queue.put(None)
         self.cleanup()
         
     def cleanup(self):
         """Properly cleanup the GUI window"""
         if not self.window_closed and self.root:
+            self.window_closed = True
             try:
-                self.window_closed = True
                 # Unbind all events to prevent background errors
-                try:
-                    self.root.unbind_all('<Control-Return>')
-                    self.root.unbind_all('<Escape>')
-                    self.root.unbind_all('<Control-l>')
-                except:
-                    pass
-                
-                # Update to flush all pending events
-                try:
-                    self.root.update()
-                except:
-                    pass
-                
-                # Withdraw window before destroying
-                try:
-                    self.root.withdraw()
-                except:
-                    pass
-                
-                # Quit mainloop
-                try:
-                    self.root.quit()
-                except:
-                    pass
-                
-                # Destroy window
-                try:
-                    self.root.destroy()
-                except:
-                    pass
-                
-                # Clear references
-                self.root = None
-                self.text_area = None
-                
-            except Exception:
-                pass  # Ensure no exceptions escape
+                self.root.unbind_all('<Control-Return>')
+                self.root.unbind_all('<Escape>')
+                self.root.unbind_all('<Control-l>')
+                self.root.quit()
+                self.root.destroy()
+            except TclError:
+                pass  # Window already torn down
         
     def run(self):
         """Run the GUI"""
@@ -478,30 +375,165 @@ class InstructionGUI:
             print(f"⚠️  GUI Error: {e}")
             return None
         finally:
-            # Ensure cleanup even if there's an error
+            # Ensure cleanup even if there's an error; destroy() is synchronous
             self.cleanup()
-            # Additional delay to ensure all cleanup is complete
-            import time
-            time.sleep(0.1)
+
+# Static terminal panels, each emitted with a single write
+_SEP = "=" * 50
+
+_BANNER_TMPL = "\n" + _SEP + """
+🔄 GITHUB COPILOT REVIEW CHECKPOINT
+""" + _SEP + """
+⏰ Time: {time}
+📍 Current task completed
+""" + "-"*50 + "\n"
+
+_OPTIONS_TEXT = """
+💬 What would you like to do next?
+
+📋 Options:
+   🔄 Continue: Describe changes, improvements, or new features
+   ✅ Finish: Type 'done' or 'finish' to complete session
+   ❓ Help: Type 'help' for more options
+   📝 GUI: Type 'gui' or 'edit' to open detailed instruction editor
+
+""" + "-"*50 + "\n"
+
+_HELP_TEXT = "\n" + _SEP + """
+📚 HELP - How to use this review checkpoint:
+""" + _SEP + """
+
+🔄 TO CONTINUE:
+   - Describe what you want to change or add
+   - Example: 'Add a dark mode toggle'
+   - Example: 'Fix the responsive design issues'
+   - Example: 'Add more animations'
+
+📝 DETAILED INSTRUCTIONS (GUI):
+   - Type: 'gui', 'edit', or 'editor' to open GUI
+   - Write detailed instructions with bullets and formatting
+   - After submitting, you can type 'edit' to modify the same content
+   - Use Ctrl+Enter to quickly submit from GUI
+   - Set FLOW_USE_TUI=1 to edit in the terminal instead (needs prompt_toolkit)
+
+✅ TO FINISH:
+   - Type: 'done' or 'finish' (as standalone words)
+   - The session will end with a summary
+
+💡 TIPS:
+   - Use GUI for complex, multi-step instructions
+   - After GUI input, you can edit the same content multiple times
+   - Be specific about what you want
+   - You can ask for multiple changes at once
+   - GitHub Copilot will continue from where it left off
+
+""" + "-"*50 + "\n"
 
 def print_banner():
     """Print the review banner"""
-    print("\n" + "="*50)
-    print("🔄 GITHUB COPILOT REVIEW CHECKPOINT")
-    print("="*50)
-    print(f"⏰ Time: {datetime.now().strftime('%H:%M:%S')}")
-    print(f"📍 Current task completed")
-    print("-"*50)
+    sys.stdout.write(_BANNER_TMPL.format(time=datetime.now().strftime('%H:%M:%S')))
+    sys.stdout.flush()
+
+def _report_backend():
+    """Tell the user which GUI backend the editor uses, on first use only"""
+    global _BACKEND_REPORTED
+    if _BACKEND_REPORTED:
+        return
+    _BACKEND_REPORTED = True
+    if TTK_AVAILABLE:
+        print("✅ ttkbootstrap available - Using modern UI")
+    else:
+        print("⚠️  ttkbootstrap not available - Using standard tkinter")
+        print("💡 Install with: pip install ttkbootstrap")
+
+def run_gui_helper(current_content):
+    """Run the GUI helper and return (result message or None, exit code, stderr)"""
+    import tempfile
+    
+    _report_backend()
+    
+    # stderr goes to a temp file: nothing reads it while stdout is being
+    # followed, and a full stderr pipe would stall the helper
+    with tempfile.TemporaryFile('w+', errors='replace') as err:
+        proc = subprocess.Popen(
+            [sys.executable, _GUI_HELPER_PATH, current_content],
+            stdout=subprocess.PIPE,
+            stderr=err,
+            text=True,
+            bufsize=1
+        )
+        msg = _read_gui_result(proc)
+        err.seek(0)
+        return msg, proc.returncode, err.read()
+
+def _read_gui_result(proc):
+    """Follow the helper's stdout until its result line, then reap the process"""
+    # Close the editor if it is left open past the timeout
+    expired = threading.Event()
+    def expire():
+        expired.set()
+        proc.kill()
+    watchdog = threading.Timer(GUI_TIMEOUT, expire)
+    watchdog.start()
+    
+    # Stop reading as soon as the result line arrives
+    msg = None
+    try:
+        for line in proc.stdout:
+            if line.startswith(GUI_RESULT_PREFIX):
+                msg = json.loads(line[len(GUI_RESULT_PREFIX):])
+                break
+    except BaseException:
+        # Bad result line or Ctrl+C - don't leave the helper running
+        proc.kill()
+        proc.communicate()
+        raise
+    finally:
+        watchdog.cancel()
+    
+    if expired.is_set():
+        proc.communicate()
+        raise subprocess.TimeoutExpired(proc.args, GUI_TIMEOUT)
+    
+    try:
+        proc.communicate(timeout=5)
+    except subprocess.TimeoutExpired:
+        # The result is already in hand; a slow exit must not discard it
+        proc.kill()
+        proc.communicate()
+    return msg
+
+def tui_edit(initial_text):
+    """Edit instructions in the terminal with prompt_toolkit and return a result message"""
+    from prompt_toolkit import PromptSession
+    
+    print("⌨️  Esc then Enter to submit | Ctrl+C to cancel")
+    try:
+        content = PromptSession(multiline=True).prompt("> ", default=initial_text)
+    except (KeyboardInterrupt, EOFError):
+        return {"status": "cancelled"}
+    return {"status": "ok", "content": content.strip()}
+
+def use_tui():
+    """True when FLOW_USE_TUI asks for the terminal editor and prompt_toolkit is installed"""
+    if not os.environ.get("FLOW_USE_TUI"):
+        return False
+    if importlib.util.find_spec("prompt_toolkit") is None:
+        print("⚠️  prompt_toolkit not available - Using GUI editor")
+        print("💡 Install with: pip install prompt_toolkit")
+        return False
+    return True
+
+def open_editor(current_content, tui):
+    """Open the terminal editor if tui is set, otherwise the GUI helper"""
+    if tui:
+        return tui_edit(current_content), 0, ""
+    return run_gui_helper(current_content)
 
 def get_user_input():
     """Get user feedback and instructions"""
-    print("\n💬 What would you like to do next?")
-    print("\n📋 Options:")
-    print("   🔄 Continue: Describe changes, improvements, or new features")
-    print("   ✅ Finish: Type 'done' or 'finish' to complete session")
-    print("   ❓ Help: Type 'help' for more options")
-    print("   📝 GUI: Type 'gui' or 'edit' to open detailed instruction editor")
-    print("\n" + "-"*50)
+    sys.stdout.write(_OPTIONS_TEXT)
+    sys.stdout.flush()
     
     while True:
         try:
@@ -512,42 +544,32 @@ def get_user_input():
                 continue
             
             # Check if user wants to open GUI
-            if user_input.lower() in ['gui', 'edit', 'editor']:
+            if user_input.lower() in _GUI_KEYWORDS:
                 current_content = ""
+                # Decided once, so the messages below name the editor actually used
+                tui = use_tui()
+                editor = "terminal editor" if tui else "GUI editor"
                 
                 while True:  # Loop for GUI editing
-                    print("🔄 Opening GUI editor...")
+                    print(f"🔄 Opening {editor}...")
                     try:
-                        # Use subprocess to completely isolate GUI
-                        import subprocess
-                        import sys
-                        
-                        # Path to the GUI helper script
-                        gui_helper_path = os.path.join(os.path.dirname(__file__), 'gui_helper.py')
-                        
-                        # Run GUI in separate process
-                        result = subprocess.run(
-                            [sys.executable, gui_helper_path, current_content],
-                            capture_output=True,
-                            text=True,
-                            timeout=300  # 5 minute timeout
-                        )
+                        # Edit in the terminal or run GUI in separate process
+                        msg, returncode, stderr = open_editor(current_content, tui)
                         
-                        # Parse result
-                        if result.returncode == 0:
-                            output = result.stdout.strip()
-                            if "GUI_RESULT_CANCELLED" in output:
-                                print("❌ GUI cancelled by user")
+                        # Parse result - the helper reports back with one prefixed JSON line
+                        if returncode == 0 or msg is not None:
+                            if msg is None:
+                                print("⚠️  Unexpected GUI output")
+                                break
+                            elif msg["status"] == "cancelled":
+                                print(f"❌ {editor} cancelled by user")
                                 break
-                            elif "GUI_RESULT_START" in output and "GUI_RESULT_END" in output:
-                                # Extract content between markers
-                                start_idx = output.find("GUI_RESULT_START") + len("GUI_RESULT_START")
-                                end_idx = output.find("GUI_RESULT_END")
-                                content = output[start_idx:end_idx].strip()
+                            else:
+                                content = msg["content"]
                                 
                                 if content:
                                     current_content = content
-                                    print(f"\n✅ Instructions received from GUI:")
+                                    print(f"\n✅ Instructions received from {editor}:")
                                     print("=" * 60)
                                     print(content)
                                     print("=" * 60)
@@ -558,26 +580,23 @@ def get_user_input():
                                     choice = input("👤 Your choice: ").strip().lower()
                                     
                                     if choice == 'edit':
-                                        print("🔄 Reopening GUI editor with current content...")
+                                        print(f"🔄 Reopening {editor} with current content...")
                                         continue  # Continue the GUI editing loop
                                     else:
                                         # User pressed Enter or typed something else - execute instructions
                                         return content
                                 else:
-                                    print("⚠️  No content received from GUI")
+                                    print(f"⚠️  No content received from {editor}")
                                     break
-                            else:
-                                print("⚠️  Unexpected GUI output")
-                                break
                         else:
-                            print(f"⚠️  GUI process failed: {result.stderr}")
+                            print(f"⚠️  GUI process failed: {stderr}")
                             break
                             
                     except subprocess.TimeoutExpired:
                         print("⚠️  GUI timed out")
                         break
                     except Exception as e:
-                        print(f"⚠️  Error running GUI: {e}")
+                        print(f"⚠️  Error running {editor}: {e}")
                         # Fallback to terminal input
                         break
                 
@@ -598,11 +617,9 @@ def process_input(user_input):
     input_lower = user_input.lower().strip()
     
     # Check for finish commands - only standalone words "done" or "finish"
-    import re
-    finish_keywords = ['done', 'finish']
-    for keyword in finish_keywords:
-        # Use word boundaries to match only standalone words
-        if re.search(r'\b' + re.escape(keyword) + r'\b', input_lower):
+    # (plain substring test first; the regex only runs when one could match)
+    if ('done' in input_lower) or ('finish' in input_lower):
+        if _FINISH_RE.search(input_lower):
             return 'finish', user_input
     
     # Check for help
@@ -610,8 +627,7 @@ def process_input(user_input):
         return 'help', user_input
     
     # Check for GUI keywords (handled in get_user_input, but adding here for completeness)
-    gui_keywords = ['gui', 'edit', 'editor']
-    if input_lower in gui_keywords:
+    if input_lower in _GUI_KEYWORDS:
         return 'continue', user_input  # This should be handled in get_user_input
     
     # Default to continue
@@ -619,32 +635,8 @@ def process_input(user_input):
 
 def show_help():
     """Show help information"""
-    print("\n" + "="*50)
-    print("📚 HELP - How to use this review checkpoint:")
-    print("="*50)
-    print("\n🔄 TO CONTINUE:")
-    print("   - Describe what you want to change or add")
-    print("   - Example: 'Add a dark mode toggle'")
-    print("   - Example: 'Fix the responsive design issues'")
-    print("   - Example: 'Add more animations'")
-    
-    print("\n📝 DETAILED INSTRUCTIONS (GUI):")
-    print("   - Type: 'gui', 'edit', or 'editor' to open GUI")
-    print("   - Write detailed instructions with bullets and formatting")
-    print("   - After submitting, you can type 'edit' to modify the same content")
-    print("   - Use Ctrl+Enter to quickly submit from GUI")
-    
-    print("\n✅ TO FINISH:")
-    print("   - Type: 'done' or 'finish' (as standalone words)")
-    print("   - The session will end with a summary")
-    
-    print("\n💡 TIPS:")
-    print("   - Use GUI for complex, multi-step instructions")
-    print("   - After GUI input, you can edit the same content multiple times")
-    print("   - Be specific about what you want")
-    print("   - You can ask for multiple changes at once")
-    print("   - GitHub Copilot will continue from where it left off")
-    print("\n" + "-"*50)
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
 
 def generate_response(action, user_input):
     """Generate appropriate response for GitHub Copilot"""
@@ -684,27 +676,39 @@ Continue working on this task and run the flow again when ready for the next rev
 Please wait for user to provide their actual instruction...
 """
 
+def _migrate_json_to_jsonl():
+    """Convert an old session_log.json array into JSON Lines (runs once)"""
+    if not os.path.exists(_LEGACY_LOG_PATH):
+        return
+    
+    try:
+        with open(_LEGACY_LOG_PATH, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        logs = json.loads(content) if content else []
+    except (json.JSONDecodeError, ValueError):
+        logs = []
+        print("⚠️  JSON log file was corrupted, starting fresh")
+    
+    with open(_LOG_PATH, 'a', encoding='utf-8') as f:
+        for entry in logs:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    
+    # Keep the original around but out of the way so this never runs twice
+    os.replace(_LEGACY_LOG_PATH, _LEGACY_LOG_PATH + '.migrated')
+
 def save_session_log(action, user_input):
-    """Save session interaction to log file"""
+    """Append session interaction to the JSON Lines log file"""
     log_entry = {
         'timestamp': datetime.now().isoformat(),
         'action': action,
         'user_input': user_input
     }
     
-    log_file = os.path.join(os.path.dirname(__file__), 'session_log.json')
-    
     try:
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        
-        logs.append(log_entry)
+        _migrate_json_to_jsonl()
         
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        with open(_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
             
     except Exception as e:
         print(f"⚠️  Could not save log: {e}")
@@ -727,11 +731,8 @@ def main():
             
             # Generate and print response for GitHub Copilot
             response = generate_response(action, processed_input)
-            print("\n" + "="*50)
-            print("📤 RESPONSE FOR GITHUB COPILOT:")
-            print("="*50)
-            print(response)
-            print("="*50)
+            sys.stdout.write(f"\n{_SEP}\n📤 RESPONSE FOR GITHUB COPILOT:\n{_SEP}\n{response}\n{_SEP}\n")
+            sys.stdout.flush()
             
             # Exit after providing response
             break
@@ -4,6 +4,10 @@ Standalone GUI helper for flow.py to avoid window destruction errors
 """
 import sys
 import os
+import json
+
+# Prefix of the single JSON result line read back by flow.py
+GUI_RESULT_PREFIX = "FLOW_RESULT:"
 
 # Try ttkbootstrap first, fallback to tkinter
 try:
@@ -341,16 +345,17 @@ class StandaloneGUI:
             messagebox.showwarning("Empty Content", "Please enter some instructions.")
             return
         
-        # Print result to stdout so parent process can capture it
-        print("GUI_RESULT_START")
-        print(content)
-        print("GUI_RESULT_END")
+        # Report the result to the parent process as one JSON line; stdout is
+        # a pipe, so flush now rather than when the process exits
+        sys.stdout.write(GUI_RESULT_PREFIX + json.dumps({"status": "ok", "content": content}) + "\n")
+        sys.stdout.flush()
         
         self.root.quit()
         self.root.destroy()
     
     def cancel(self):
-        print("GUI_RESULT_CANCELLED")
+        sys.stdout.write(GUI_RESULT_PREFIX + json.dumps({"status": "cancelled"}) + "\n")
+        sys.stdout.flush()
         self.root.quit()
         self.root.destroy()
     